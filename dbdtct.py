@@ -1,12 +1,31 @@
 import requests
 import argparse
+import re
 import concurrent.futures
 import asyncio
 import aiohttp
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 import time
 import socket
+import sys
+import os
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Disable SSL warnings
 requests.packages.urllib3.disable_warnings()
@@ -71,135 +90,271 @@ KNOWN_DEBUG_PATHS = [
     "configuration.php"
 ]
 
-METHODS = ["GET", "POST", "PUT"]
+LOWER_PATTERNS = tuple(pattern.lower() for pattern in DEBUG_PATTERNS)
+
+# Caseless alternation over all patterns, used when neither hyperscan nor
+# pyahocorasick is installed
+PATTERN_REGEX = re.compile(
+    b'|'.join(re.escape(pattern.encode()) for pattern in DEBUG_PATTERNS),
+    re.IGNORECASE
+)
+PATTERNS_BY_LOWER = {lower.encode(): pattern for lower, pattern in zip(LOWER_PATTERNS, DEBUG_PATTERNS)}
+
+# Single automaton over all patterns, keyed on the lowercased form
+PATTERN_AUTOMATON = None
+if ahocorasick:
+    PATTERN_AUTOMATON = ahocorasick.Automaton()
+    for lower, pattern in zip(LOWER_PATTERNS, DEBUG_PATTERNS):
+        PATTERN_AUTOMATON.add_word(lower, pattern)
+    PATTERN_AUTOMATON.make_automaton()
+
+# Caseless literal database, used instead of the automaton when hyperscan is installed
+PATTERN_DATABASE = None
+if hyperscan:
+    PATTERN_DATABASE = hyperscan.Database()
+    PATTERN_DATABASE.compile(
+        expressions=[re.escape(pattern).encode() for pattern in DEBUG_PATTERNS],
+        ids=list(range(len(DEBUG_PATTERNS))),
+        elements=len(DEBUG_PATTERNS),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(DEBUG_PATTERNS)
+    )
+
+# Bodies are scanned as they arrive; each chunk is prefixed with the tail of the
+# previous one so a pattern split across a chunk boundary is still found
+CHUNK_SIZE = 8192
+CHUNK_OVERLAP = max(len(pattern) for pattern in DEBUG_PATTERNS) - 1
+
+# GET is already covered by the initial request in check_url
+METHODS = ["POST", "PUT"]
+# Pre-encoded so aiohttp sends them as-is instead of encoding a str per request
 MALFORMED_JSON = [
-'{"foo":"bar"'
+b'{"foo":"bar"'
 ]
 
+# Shared by every DebugDetector on the same event loop so repeated scans reuse
+# pooled connections. Each detector holds one reference from init_session()
+# until its aclose(); the session is closed when the last reference goes
+_SESSION = None
+_SESSION_LOOP = None
+_SESSION_USERS = 0
+
+@lru_cache(maxsize=4096)
+def resolve_host(hostname):
+    return socket.gethostbyname(hostname)
+
 class DebugDetector:
     def __init__(self, max_workers=20, timeout=5):
         self.max_workers = max_workers
-        self.timeout = timeout
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.session = None
+        self.semaphore = None
+        self.loop = None
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/json,*/*',
             'Connection': 'keep-alive'
         }
+        self.json_headers = {**self.headers, 'Content-Type': 'application/json'}
 
     async def init_session(self):
-        if not self.session:
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-            connector = aiohttp.TCPConnector(limit=self.max_workers, ssl=False)
-            self.session = aiohttp.ClientSession(
-                connector=connector,
-                timeout=timeout,
-                headers=self.headers
-            )
-
-    def check_debug_patterns(self, response_text):
-        response_lower = response_text.lower()
-        for pattern in DEBUG_PATTERNS:
-            if pattern.lower() in response_lower:
+        # No lock: nothing here awaits, so no other coroutine can run between
+        # checking the shared session and updating it
+        global _SESSION, _SESSION_LOOP, _SESSION_USERS
+        loop = asyncio.get_running_loop()
+        if self.loop is not loop:
+            # Semaphores and sessions belong to the loop they were first used on
+            self.loop = loop
+            self.semaphore = asyncio.Semaphore(self.max_workers)
+            self.session = None
+        if self.session is not None and self.session is _SESSION:
+            return
+
+        # A session from another loop can't be used or closed here; it is only
+        # left behind when a detector skipped aclose(), and aiohttp warns about it
+        if _SESSION_LOOP is not loop or _SESSION.closed:
+            # Concurrency is bounded by each detector's semaphore, not the pool
+            connector = aiohttp.TCPConnector(limit=0, ssl=False)
+            _SESSION = aiohttp.ClientSession(connector=connector)
+            _SESSION_LOOP = loop
+            _SESSION_USERS = 0
+        _SESSION_USERS += 1
+        self.session = _SESSION
+
+    async def aclose(self):
+        global _SESSION, _SESSION_LOOP, _SESSION_USERS
+        session, self.session = self.session, None
+        if session is None or session is not _SESSION:
+            return
+        _SESSION_USERS -= 1
+        if _SESSION_USERS == 0:
+            _SESSION = None
+            _SESSION_LOOP = None
+            await session.close()
+
+    def check_debug_patterns(self, body):
+        if PATTERN_DATABASE:
+            found = []
+
+            def on_match(pattern_id, start, end, flags, context):
+                found.append(DEBUG_PATTERNS[pattern_id])
+                return True
+
+            try:
+                PATTERN_DATABASE.scan(body, match_event_handler=on_match)
+            except hyperscan.ScanTerminated:
+                pass
+            return found[0] if found else None
+
+        if PATTERN_AUTOMATON:
+            # Patterns are ASCII, so an ASCII-only bytes.lower() is enough and latin-1
+            # maps each byte to one character without a real decode
+            for _, pattern in PATTERN_AUTOMATON.iter(body.lower().decode('latin-1')):
                 return pattern
+            return None
+
+        if match := PATTERN_REGEX.search(body):
+            return PATTERNS_BY_LOWER[match.group(0).lower()]
         return None
 
     async def make_request(self, url, method='GET', data=None):
+        # Queue here rather than inside the connector's pool
+        async with self.semaphore:
+            return await self._make_request(url, method, data)
+
+    async def _make_request(self, url, method, data):
         try:
-            headers = self.headers.copy()
-            if data and isinstance(data, str) and data.startswith('{'):
-                headers['Content-Type'] = 'application/json'
-                
-            async with getattr(self.session, method.lower())(
+            if data and data.startswith(b'{'):
+                headers = self.json_headers
+            else:
+                headers = self.headers
+
+            async with self.session.request(
+                method,
                 url, 
                 data=data,
                 headers=headers,
+                timeout=self.timeout,
                 ssl=False
             ) as response:
                 if response.status == 404:
-                    return 404, ""
-                text = await response.text()
-                return response.status, text
-        except:
-            return 0, ""
+                    return 404, None
+                tail = b""
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    window = tail + chunk
+                    if match := self.check_debug_patterns(window):
+                        # Drop the connection instead of reading the rest of the body
+                        response.close()
+                        return response.status, match
+                    tail = window[-CHUNK_OVERLAP:]
+                return response.status, None
+        # ValueError covers malformed target URLs rejected by yarl
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError, ValueError):
+            return 0, None
+
+    async def head_status(self, url):
+        async with self.semaphore:
+            try:
+                async with self.session.head(
+                    url,
+                    allow_redirects=True,
+                    headers=self.headers,
+                    timeout=self.timeout,
+                    ssl=False
+                ) as response:
+                    return response.status
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError, ValueError):
+                return 0
+
+    async def check_debug_path(self, url):
+        # Most debug paths 404; a HEAD settles that without a body and leaves the
+        # connection reusable. Anything else (including 405 or errors) gets a GET
+        if await self.head_status(url) == 404:
+            return 404, None
+        return await self.make_request(url)
+
+    async def check_ip_access(self, parsed):
+        if not parsed.hostname:
+            return 0, None
+        loop = asyncio.get_running_loop()
+        try:
+            ip = await loop.run_in_executor(None, resolve_host, parsed.hostname)
+            netloc = ip if parsed.port is None else f"{ip}:{parsed.port}"
+            # Keep any user:pass@ so authenticated targets stay authenticated
+            userinfo, at, _ = parsed.netloc.rpartition("@")
+            netloc = userinfo + at + netloc
+        except (OSError, ValueError):
+            return 0, None
+        # The Host header must carry the IP too: apps that only answer for their
+        # configured hostnames (e.g. Django's ALLOWED_HOSTS) leak debug pages here
+        ip_url = parsed._replace(netloc=netloc).geturl()
+        return await self.make_request(ip_url)
 
     async def check_url(self, url):
         results = []
+        try:
+            parsed = urlparse(url)
+        except ValueError:
+            # e.g. an unterminated IPv6 host; nothing can be probed
+            return url, []
         
         # Basic GET request
-        status, text = await self.make_request(url)
+        status, match = await self.make_request(url)
         if status == 404:
             return url, []
         
-        if match := self.check_debug_patterns(text):
+        if match:
             results.append(("Simple GET", match))
 
+        # The remaining probes are independent, so send them all at once
+        probes = []
+
         # Check different HTTP methods
         for method in METHODS:
-            status, text = await self.make_request(url, method=method)
-            if status == 404:
-                continue
-            match = self.check_debug_patterns(text)
-            if match:
-                results.append((f"HTTP Method {method}", match))
+            probes.append((f"HTTP Method {method}", self.make_request(url, method=method)))
 
         # Test malformed JSON payloads
         for malformed in MALFORMED_JSON:
-            try:
-                status, text = await self.make_request(
-                    url, 
-                    method='POST', 
-                    data=malformed
-                )
-                if status != 404:
-                    match = self.check_debug_patterns(text)
-                    if match:
-                        results.append((f"Malformed JSON ({malformed})", match))
-            except:
-                continue
+            probes.append((
+                f"Malformed JSON ({malformed.decode()})",
+                self.make_request(url, method='POST', data=malformed)
+            ))
 
         # Try accessing by IP
-        try:
-            parsed = urlparse(url)
-            ip = socket.gethostbyname(parsed.hostname)
-            ip_url = url.replace(parsed.hostname, ip)
-            
-            status, text = await self.make_request(ip_url)
-            if status != 404:
-                match = self.check_debug_patterns(text)
-                if match:
-                    results.append(("IP-based access", match))
-        except:
-            pass
+        probes.append(("IP-based access", self.check_ip_access(parsed)))
 
         # Check debug paths
-        debug_tasks = []
+        # One parse per target instead of a urljoin per path; query and fragment
+        # are dropped, as urljoin did
+        base = parsed._replace(query="", fragment="").geturl().rstrip("/") + "/"
         for path in KNOWN_DEBUG_PATHS:
-            debug_url = urljoin(url + "/", path)
-            debug_tasks.append(self.make_request(debug_url))
-        
-        debug_responses = await asyncio.gather(*debug_tasks)
-        for path, (status, text) in zip(KNOWN_DEBUG_PATHS, debug_responses):
-            if status == 404:
-                continue
-            match = self.check_debug_patterns(text)
-            if match:
-                results.append((f"Debug path: {path}", match))
+            debug_url = base + path
+            probes.append((f"Debug path: {path}", self.check_debug_path(debug_url)))
+
+        # Every probe handles its own network errors, so anything raised here is a bug
+        responses = await asyncio.gather(*(probe for _, probe in probes))
+        for (technique, _), (status, match) in zip(probes, responses):
+            if status != 404 and match:
+                results.append((technique, match))
 
         return url, results
 
     async def scan_urls(self, urls):
         await self.init_session()
         tasks = [self.check_url(url) for url in urls]
-        results = await asyncio.gather(*tasks)
-        
-        if self.session:
-            await self.session.close()
-        
-        return results
+        return await asyncio.gather(*tasks)
 
-def print_banner():
-    logo = f'''
+    async def iter_scan(self, urls):
+        await self.init_session()
+        tasks = [asyncio.ensure_future(self.check_url(url)) for url in urls]
+        try:
+            # Yield each target as soon as it finishes instead of after the whole list
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+LOGO = '''
   ,--.,--.      ,--.  ,--.          ,--.   
  ,-|  ||  |-.  ,-|  |,-'  '-. ,---.,-'  '-. 
 ' .-. || .-. '' .-. |'-.  .-'| .--''-.  .-' 
@@ -211,7 +366,20 @@ def print_banner():
             
 [ Debug Mode Scanner - Test various methods to detect debug mode ]
 '''
-    print(logo)
+
+@lru_cache(maxsize=None)
+def encode_banner(encoding, errors):
+    # Same bytes print() would produce, including newline translation on Windows
+    return (LOGO + "\n").replace("\n", os.linesep).encode(encoding, errors)
+
+def print_banner():
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        # StringIO redirects, some IDEs and pythonw have no byte stream
+        print(LOGO)
+        return
+    buffer.write(encode_banner(sys.stdout.encoding, sys.stdout.errors))
+    buffer.flush()
 
 async def main():
     print_banner()
@@ -227,6 +395,8 @@ async def main():
     if args.list:
         with open(args.list, 'r') as f:
             urls.extend(line.strip() for line in f if line.strip())
+    # A target listed twice would be scanned twice
+    urls = list(dict.fromkeys(urls))
 
     if not urls:
         parser.error("No URLs provided. Use -u or -l option.")
@@ -236,19 +406,21 @@ async def main():
     print(f"[*] Testing {len(urls)} target(s)")
     
     detector = DebugDetector(max_workers=args.workers)
-    results = await detector.scan_urls(urls)
 
     # Print results
     vulnerable_count = 0
-    for url, findings in results:
-        if findings:
-            vulnerable_count += 1
-            print(f"\n[+] Potential Debug Mode Detected on {url}")
-            for method, match in findings:
-                print(f"    -> Technique: {method}")
-                print(f"    -> Fingerprint: {match}")
-        else:
-            print(f"[-] No debug patterns found on {url}")
+    try:
+        async for url, findings in detector.iter_scan(urls):
+            if findings:
+                vulnerable_count += 1
+                print(f"\n[+] Potential Debug Mode Detected on {url}")
+                for method, match in findings:
+                    print(f"    -> Technique: {method}")
+                    print(f"    -> Fingerprint: {match}")
+            else:
+                print(f"[-] No debug patterns found on {url}")
+    finally:
+        await detector.aclose()
 
     scan_time = time.time() - start_time
     print(f"\n[*] Scan Summary:")
@@ -258,4 +430,7 @@ async def main():
     print(f"    -> Success rate: {(vulnerable_count/len(urls))*100:.1f}%")
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    if uvloop:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())